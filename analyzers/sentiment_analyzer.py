@@ -4,7 +4,8 @@ Uses VADER sentiment analysis optimized for social media text
 """
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from textblob import TextBlob
-from typing import List, Dict, Any, Tuple
+import numpy as np
+from typing import List, Dict, Any
 from app.models import RedditPost, NewsArticle, SentimentMetrics
 
 class SentimentAnalyzer:
@@ -58,12 +59,18 @@ class SentimentAnalyzer:
         else:
             return "Neutral"
     
-    def analyze_reddit_post(self, post: RedditPost) -> RedditPost:
-        """Analyze sentiment and enhanced metrics of a Reddit post"""
+    def analyze_reddit_post(self, post: RedditPost, now: float = None) -> RedditPost:
+        """Analyze sentiment and enhanced metrics of a Reddit post
+        
+        `now` is the reference timestamp for the post's age; batch callers pass one shared value.
+        """
         # Import here to avoid circular imports
         from analyzers.content_analyzer import content_analyzer
         from datetime import datetime
         
+        if now is None:
+            now = datetime.now().timestamp()
+        
         # Combine title and selftext for analysis
         text_to_analyze = f"{post.title} {post.selftext}".strip()
         
@@ -79,7 +86,7 @@ class SentimentAnalyzer:
         post.readability_score = readability['score']
         
         # Calculate engagement velocity
-        hours_old = max((datetime.now().timestamp() - post.created_utc) / 3600, 0.1)
+        hours_old = max((now - post.created_utc) / 3600, 0.1)
         post.engagement_velocity = (post.score + post.num_comments * 2) / hours_old
         
         # Calculate virality score using content analyzer
@@ -96,11 +103,15 @@ class SentimentAnalyzer:
     
     def analyze_reddit_posts(self, posts: List[RedditPost]) -> List[RedditPost]:
         """Analyze sentiment for multiple Reddit posts"""
+        from datetime import datetime
+        
+        # One reference time for the whole batch keeps velocities comparable
+        now = datetime.now().timestamp()
         analyzed_posts = []
         
         for post in posts:
             try:
-                analyzed_post = self.analyze_reddit_post(post)
+                analyzed_post = self.analyze_reddit_post(post, now=now)
                 analyzed_posts.append(analyzed_post)
             except Exception as e:
                 print(f"Error analyzing Reddit post {post.id}: {e}")
@@ -188,6 +199,29 @@ class SentimentAnalyzer:
         reddit_metrics = self.get_sentiment_metrics(reddit_posts)
         news_metrics = self.get_sentiment_metrics(news_articles)
         
+        return self._build_platform_comparison(reddit_metrics, news_metrics)
+    
+    def compare_platform_sentiment_counts(self, reddit_counts: Dict[str, Any],
+                                          news_counts: Dict[str, Any]) -> Dict[str, Any]:
+        """Compare platform sentiment from pre-aggregated counts (see Database.get_platform_sentiment_counts)"""
+        return self._build_platform_comparison(
+            self._metrics_from_counts(reddit_counts),
+            self._metrics_from_counts(news_counts)
+        )
+    
+    def _metrics_from_counts(self, counts: Dict[str, Any]) -> SentimentMetrics:
+        """Build SentimentMetrics from aggregated totals instead of individual items"""
+        metrics = SentimentMetrics()
+        metrics.total_items = int(counts['total_items'])
+        metrics.average_score = float(counts['average_score'])
+        metrics.positive_count = int(counts['positive_count'])
+        metrics.negative_count = int(counts['negative_count'])
+        metrics.neutral_count = metrics.total_items - metrics.positive_count - metrics.negative_count
+        return metrics
+    
+    def _build_platform_comparison(self, reddit_metrics: SentimentMetrics,
+                                   news_metrics: SentimentMetrics) -> Dict[str, Any]:
+        """Combine per-platform metrics into the comparison structure"""
         return {
             'reddit': reddit_metrics.to_dict(),
             'news': news_metrics.to_dict(),
@@ -201,22 +235,18 @@ class SentimentAnalyzer:
     
     def get_sentiment_trends_by_time(self, posts: List[RedditPost], hours_back: int = 24) -> List[Dict[str, Any]]:
         """Get sentiment trends over time"""
-        from datetime import datetime, timedelta
+        from datetime import datetime
         import pandas as pd
         
-        # Convert to DataFrame for easier time analysis
-        data = []
-        for post in posts:
-            data.append({
-                'timestamp': datetime.fromtimestamp(post.created_utc),
-                'sentiment': post.sentiment_score,
-                'subreddit': post.subreddit
-            })
-        
-        if not data:
+        if not posts:
             return []
         
-        df = pd.DataFrame(data)
+        # Convert to DataFrame for easier time analysis, one column at a time
+        df = pd.DataFrame({
+            'timestamp': [datetime.fromtimestamp(post.created_utc) for post in posts],
+            'sentiment': np.fromiter((post.sentiment_score for post in posts), dtype=float, count=len(posts)),
+            'subreddit': [post.subreddit for post in posts]
+        })
         
         # Group by hour and calculate average sentiment
         df['hour'] = df['timestamp'].dt.floor('H')
@@ -239,17 +269,13 @@ class SentimentAnalyzer:
         if not posts:
             return []
         
-        # Convert to DataFrame
-        data = []
-        for post in posts:
-            data.append({
-                'subreddit': post.subreddit,
-                'sentiment': post.sentiment_score,
-                'score': post.score,
-                'comments': post.num_comments
-            })
-        
-        df = pd.DataFrame(data)
+        # Convert to DataFrame from per-column arrays
+        df = pd.DataFrame({
+            'subreddit': [post.subreddit for post in posts],
+            'sentiment': np.fromiter((post.sentiment_score for post in posts), dtype=float, count=len(posts)),
+            'score': np.fromiter((post.score for post in posts), dtype=float, count=len(posts)),
+            'comments': np.fromiter((post.num_comments for post in posts), dtype=float, count=len(posts))
+        })
         
         # Group by subreddit and calculate metrics
         subreddit_stats = df.groupby('subreddit').agg({
@@ -265,6 +291,10 @@ class SentimentAnalyzer:
         # Sort by average sentiment
         subreddit_stats = subreddit_stats.sort_values('avg_sentiment', ascending=False)
         
+        return self.rank_subreddit_stats(subreddit_stats)
+    
+    def rank_subreddit_stats(self, subreddit_stats) -> List[Dict[str, Any]]:
+        """Build the subreddit ranking from per-subreddit stats already sorted by avg_sentiment"""
         ranking = []
         for _, row in subreddit_stats.iterrows():
             ranking.append({
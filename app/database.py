@@ -4,7 +4,9 @@ Handles SQLite database creation, connections, and basic operations
 """
 import sqlite3
 import os
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from app.config import config
 
@@ -13,6 +15,8 @@ class Database:
     
     def __init__(self):
         self.db_path = config.DATABASE_PATH
+        self._read_conn = None
+        self._read_lock = threading.Lock()
         self.ensure_database_exists()
         self.create_tables()
     
@@ -21,12 +25,32 @@ class Database:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get a new database connection, used for writes"""
+        # Reddit and news collectors can insert at the same time; wait for the other writer's lock
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def read_connection(self):
+        """Borrow the shared long-lived read connection
+        
+        One connection serves every caller, including each Streamlit rerun's new script
+        thread, so the lock hands it to one query at a time. With the database in WAL
+        mode, these reads never wait behind a collector's write transaction.
+        """
+        with self._read_lock:
+            if self._read_conn is None:
+                self._read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._read_conn.execute("PRAGMA mmap_size=268435456")
+            yield self._read_conn
     
     def create_tables(self):
         """Create all required tables"""
         with self.get_connection() as conn:
+            # WAL is persistent in the database file, so every later connection uses it
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             cursor = conn.cursor()
             
             # Reddit posts table (Enhanced with more fields)
@@ -41,6 +65,7 @@ class Database:
                     url TEXT,
                     selftext TEXT,
                     created_utc REAL,
+                    hour_bucket INTEGER,
                     sentiment_score REAL,
                     upvote_ratio REAL DEFAULT 0,
                     post_flair TEXT,
@@ -143,9 +168,19 @@ class Database:
                 )
             """)
             
+            # Databases created before hour_bucket existed get the column and a backfill
+            reddit_columns = [row[1] for row in cursor.execute("PRAGMA table_info(reddit_posts)")]
+            if 'hour_bucket' not in reddit_columns:
+                cursor.execute("ALTER TABLE reddit_posts ADD COLUMN hour_bucket INTEGER")
+                cursor.execute("""
+                    UPDATE reddit_posts 
+                    SET hour_bucket = CAST(created_utc AS INTEGER) - CAST(created_utc AS INTEGER) % 3600
+                """)
+            
             # Create indexes for better performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_reddit_subreddit ON reddit_posts(subreddit)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_reddit_created ON reddit_posts(created_utc)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_reddit_hour_bucket ON reddit_posts(hour_bucket)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_reddit_score ON reddit_posts(score)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_reddit_virality ON reddit_posts(virality_score)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_published ON news_articles(published_at)")
@@ -166,15 +201,16 @@ class Database:
                 cursor.execute("""
                     INSERT OR REPLACE INTO reddit_posts 
                     (id, title, subreddit, author, score, num_comments, url, selftext, 
-                     created_utc, sentiment_score, upvote_ratio, post_flair, is_nsfw, 
+                     created_utc, hour_bucket, sentiment_score, upvote_ratio, post_flair, is_nsfw, 
                      is_spoiler, is_locked, post_type, domain, gilded, distinguished, 
                      stickied, total_awards_received, curse_word_count, readability_score, 
                      engagement_velocity, virality_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     post['id'], post['title'], post['subreddit'], post['author'],
                     post['score'], post['num_comments'], post['url'], post['selftext'],
-                    post['created_utc'], post['sentiment_score'], post.get('upvote_ratio', 0),
+                    post['created_utc'], int(post['created_utc']) - int(post['created_utc']) % 3600,
+                    post['sentiment_score'], post.get('upvote_ratio', 0),
                     post.get('post_flair', ''), post.get('is_nsfw', False), 
                     post.get('is_spoiler', False), post.get('is_locked', False),
                     post.get('post_type', 'text'), post.get('domain', ''), post.get('gilded', 0),
@@ -219,33 +255,57 @@ class Database:
             conn.commit()
             return inserted
     
-    def get_recent_reddit_posts(self, hours=24):
-        """Get Reddit posts from last N hours"""
+    def get_recent_reddit_posts(self, hours=24, columns=None):
+        """Get Reddit posts from last N hours, optionally only the given columns"""
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
         
-        query = """
-            SELECT * FROM reddit_posts 
+        query = f"""
+            SELECT {', '.join(columns) if columns else '*'} FROM reddit_posts 
             WHERE created_utc > ? 
             ORDER BY created_utc DESC
         """
         
-        return pd.read_sql_query(query, self.get_connection(), params=[cutoff_time])
+        with self.read_connection() as conn:
+            return pd.read_sql_query(query, conn, params=[cutoff_time])
     
-    def get_recent_news_articles(self, hours=24):
-        """Get news articles from last N hours"""
+    def get_recent_news_articles(self, hours=24, columns=None):
+        """Get news articles from last N hours, optionally only the given columns"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        query = """
-            SELECT * FROM news_articles 
+        query = f"""
+            SELECT {', '.join(columns) if columns else '*'} FROM news_articles 
             WHERE published_at > ? 
             ORDER BY published_at DESC
         """
         
-        return pd.read_sql_query(query, self.get_connection(), params=[cutoff_time])
+        with self.read_connection() as conn:
+            return pd.read_sql_query(query, conn, params=[cutoff_time])
+    
+    def get_hourly_reddit_stats(self, hours=24):
+        """Get per-hour Reddit engagement and sentiment totals from last N hours"""
+        cutoff_time = datetime.now().timestamp() - (hours * 3600)
+        
+        query = """
+            SELECT 
+                hour_bucket,
+                SUM(score) as score,
+                SUM(num_comments) as num_comments,
+                AVG(sentiment_score) as sentiment_score,
+                AVG(sentiment_score * sentiment_score) as sentiment_square_mean,
+                COUNT(sentiment_score) as sentiment_count,
+                AVG(virality_score) as virality_score
+            FROM reddit_posts 
+            WHERE created_utc > ? 
+            GROUP BY hour_bucket
+            ORDER BY hour_bucket
+        """
+        
+        with self.read_connection() as conn:
+            return pd.read_sql_query(query, conn, params=[cutoff_time])
     
     def get_sentiment_summary(self):
         """Get sentiment summary across platforms"""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             # Reddit sentiment
             reddit_sentiment = pd.read_sql_query("""
                 SELECT 
@@ -256,7 +316,7 @@ class Database:
                 WHERE created_utc > ? 
                 GROUP BY subreddit
             """, conn, params=[datetime.now().timestamp() - 86400])
-            
+        
             # News sentiment
             news_sentiment = pd.read_sql_query("""
                 SELECT 
@@ -267,9 +327,55 @@ class Database:
                 WHERE published_at > datetime('now', '-24 hours')
                 GROUP BY source
             """, conn)
-            
+        
             return reddit_sentiment, news_sentiment
     
+    def get_platform_sentiment_counts(self, hours=24):
+        """Get sentiment totals for Reddit and news from last N hours, aggregated in SQL"""
+        reddit_cutoff = datetime.now().timestamp() - (hours * 3600)
+        news_cutoff = datetime.now() - timedelta(hours=hours)
+        
+        # Same positive/negative cut-offs as SentimentMetrics; NULL scores are not counted
+        query = """
+            SELECT 
+                COUNT(sentiment_score) as total_items,
+                COALESCE(AVG(sentiment_score), 0) as average_score,
+                COALESCE(SUM(sentiment_score > 0.1), 0) as positive_count,
+                COALESCE(SUM(sentiment_score < -0.1), 0) as negative_count
+            FROM {table} 
+            WHERE {time_column} > ?
+        """
+        
+        with self.read_connection() as conn:
+            reddit_counts = pd.read_sql_query(
+                query.format(table='reddit_posts', time_column='created_utc'), conn, params=[reddit_cutoff]
+            ).iloc[0].to_dict()
+            news_counts = pd.read_sql_query(
+                query.format(table='news_articles', time_column='published_at'), conn, params=[news_cutoff]
+            ).iloc[0].to_dict()
+        
+        return reddit_counts, news_counts
+    
+    def get_subreddit_sentiment_stats(self, hours=24):
+        """Get per-subreddit sentiment, score and comment averages from last N hours"""
+        cutoff_time = datetime.now().timestamp() - (hours * 3600)
+        
+        query = """
+            SELECT 
+                subreddit,
+                ROUND(AVG(sentiment_score), 3) as avg_sentiment,
+                COUNT(sentiment_score) as post_count,
+                ROUND(AVG(score), 3) as avg_score,
+                ROUND(AVG(num_comments), 3) as avg_comments
+            FROM reddit_posts 
+            WHERE created_utc > ? 
+            GROUP BY subreddit
+            ORDER BY avg_sentiment DESC
+        """
+        
+        with self.read_connection() as conn:
+            return pd.read_sql_query(query, conn, params=[cutoff_time])
+    
     def clean_old_data(self, days=7):
         """Clean data older than N days"""
         with self.get_connection() as conn:
@@ -3,8 +3,8 @@ Data collection scheduler for Social Pulse Analytics
 Handles automated data collection from Reddit and News sources
 """
 import schedule
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -20,6 +20,7 @@ class DataCollectionScheduler:
     def __init__(self):
         self.is_running = False
         self.scheduler_thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
         self.last_collection_time: Optional[datetime] = None
         self.collection_stats = {
             'total_runs': 0,
@@ -93,14 +94,12 @@ class DataCollectionScheduler:
             # Validate configuration
             config.validate_config()
             
-            # Collect Reddit data
-            reddit_success = self.collect_reddit_data()
-            
-            # Wait a moment between collections
-            time.sleep(2)
-            
-            # Collect news data
-            news_success = self.collect_news_data()
+            # Collect Reddit and news data concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                reddit_future = executor.submit(self.collect_reddit_data)
+                news_future = executor.submit(self.collect_news_data)
+                reddit_success = reddit_future.result()
+                news_success = news_future.result()
             
             # Clean old data
             print("🧹 Cleaning old data...")
@@ -149,11 +148,14 @@ class DataCollectionScheduler:
         
         self.schedule_collection(interval_minutes)
         self.is_running = True
+        self.stop_event.clear()
         
         def run_scheduler():
             while self.is_running:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep until the next job is due; stop_scheduler wakes the thread immediately
+                idle_seconds = schedule.idle_seconds()
+                self.stop_event.wait(timeout=max(1, idle_seconds) if idle_seconds is not None else 60)
         
         self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         self.scheduler_thread.start()
@@ -163,6 +165,7 @@ class DataCollectionScheduler:
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.is_running = False
+        self.stop_event.set()
         schedule.clear()
         
         if self.scheduler_thread and self.scheduler_thread.is_alive():
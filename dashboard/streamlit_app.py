@@ -3,11 +3,14 @@ Enhanced Streamlit dashboard for Social Pulse Analytics
 Beautiful, mobile-responsive dashboard with advanced behavioral insights
 """
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import numpy as np
 
@@ -18,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import db
 from app.config import config
+from app.models import RedditPost, NewsArticle
 from collectors.reddit_collector import reddit_collector
 from collectors.news_collector import news_collector
 from analyzers.sentiment_analyzer import sentiment_analyzer
@@ -395,51 +399,80 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Minimum posts before running the full statistical breakdowns (binning, quantiles, correlations)
+MIN_POSTS_FOR_ANALYSIS = 20
+
+# Minimum posts for a subreddit to appear in community rankings
+MIN_SUBREDDIT_POSTS = 3
+
+# Columns read by the dashboard, the analyzers and the export; the rest stay in the database
+REDDIT_COLUMNS = [
+    'id', 'title', 'subreddit', 'score', 'num_comments', 'url', 'selftext', 'created_utc',
+    'sentiment_score', 'curse_word_count', 'readability_score', 'engagement_velocity', 'virality_score'
+]
+NEWS_COLUMNS = [
+    'title', 'description', 'url', 'source', 'author', 'published_at', 'sentiment_score',
+    'word_count', 'readability_score', 'urgency_score', 'emotional_tone'
+]
+
 # Auto-refresh functionality
 if 'last_refresh' not in st.session_state:
     st.session_state.last_refresh = datetime.now()
 
+@st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
 def load_data():
     """Load recent data from database"""
     try:
-        reddit_df = db.get_recent_reddit_posts(hours=24)
-        news_df = db.get_recent_news_articles(hours=24)
+        reddit_df = db.get_recent_reddit_posts(hours=24, columns=REDDIT_COLUMNS)
+        news_df = db.get_recent_news_articles(hours=24, columns=NEWS_COLUMNS)
+        
+        # Subreddit is grouped on repeatedly; categorical codes make each groupby reuse one factorization
+        if 'subreddit' in reddit_df.columns:
+            reddit_df['subreddit'] = reddit_df['subreddit'].astype('category')
+        
+        # int32 rather than the smallest fitting type, so score + num_comments cannot overflow
+        for column in ['score', 'num_comments']:
+            if column in reddit_df.columns and not reddit_df[column].isna().any():
+                reddit_df[column] = reddit_df[column].astype(np.int32)
+        
+        if 'source' in news_df.columns:
+            news_df['source'] = news_df['source'].astype('category')
+        
         return reddit_df, news_df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame(), pd.DataFrame()
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_enhanced_analytics_data():
-    """Get comprehensive analytics data with behavioral insights"""
-    reddit_df, news_df = load_data()
-    
+@st.cache_data(persist="disk", max_entries=4, show_spinner=False)
+def get_enhanced_analytics_data(reddit_df, news_df, refresh_window):
+    """Get comprehensive analytics data with behavioral insights
+    
+    Results are persisted to disk so they survive restarts. Disk-persisted caches ignore a TTL,
+    so refresh_window (the current 30-minute slot) is part of the key instead; post ages and
+    velocities are relative to the time they were computed.
+    """
     if reddit_df.empty and news_df.empty:
         return None
     
     # Convert to model objects
-    reddit_posts = []
-    if not reddit_df.empty:
-        for _, row in reddit_df.iterrows():
-            from app.models import RedditPost
-            post = RedditPost(row.to_dict())
-            reddit_posts.append(post)
-    
-    news_articles = []
-    if not news_df.empty:
-        for _, row in news_df.iterrows():
-            from app.models import NewsArticle
-            article = NewsArticle(row.to_dict())
-            news_articles.append(article)
+    reddit_posts = [RedditPost(record) for record in reddit_df.to_dict(orient='records')]
+    news_articles = [NewsArticle(record) for record in news_df.to_dict(orient='records')]
     
     # Get comprehensive analytics
     analytics = {}
     
     # Basic analytics
-    analytics['sentiment_comparison'] = sentiment_analyzer.compare_platform_sentiment(reddit_posts, news_articles)
+    # Platform and subreddit sentiment are aggregated by SQLite over the same 24h window
+    analytics['sentiment_comparison'] = sentiment_analyzer.compare_platform_sentiment_counts(*db.get_platform_sentiment_counts(hours=24))
     analytics['trending_topics'] = trend_detector.find_cross_platform_trends(reddit_posts, news_articles)
-    analytics['subreddit_sentiment'] = sentiment_analyzer.get_subreddit_sentiment_ranking(reddit_posts)
-    analytics['viral_predictions'] = trend_detector.predict_trending_topics(reddit_posts, news_articles)
+    analytics['subreddit_sentiment'] = sentiment_analyzer.rank_subreddit_stats(db.get_subreddit_sentiment_stats(hours=24))
+    # Predictions are cached as a ready-made frame so tab renders don't rebuild it
+    pred_df = pd.DataFrame(
+        trend_detector.predict_trending_topics(reddit_posts, news_articles),
+        columns=['keyword', 'viral_potential', 'mention_count', 'prediction']
+    ).sort_values('viral_potential', ascending=False).head(50)
+    analytics['viral_predictions'] = pred_df.astype({'viral_potential': np.float32, 'keyword': 'category'})
+    analytics['viral_potential'] = analytics['viral_predictions']['viral_potential'].to_numpy()
     
     # Enhanced behavioral analytics
     analytics['behavioral_report'] = behavioral_analyzer.generate_comprehensive_behavioral_report(reddit_posts, news_articles)
@@ -451,7 +484,31 @@ def get_enhanced_analytics_data():
         'most_negative': get_extreme_sentiment_posts(reddit_posts, 'negative')
     }
     
-    return analytics, reddit_df, news_df
+    # Viral thresholds shared by every tab, cached along with the rest of the analytics
+    analytics['viral_features'] = compute_viral_features(reddit_df) if not reddit_df.empty else None
+    
+    return analytics
+
+def compute_viral_features(reddit_df):
+    """Per-post engagement metrics and the viral thresholds derived from them"""
+    total_engagement = reddit_df['score'].to_numpy() + reddit_df['num_comments'].to_numpy()
+    hours_old = (datetime.now().timestamp() - reddit_df['created_utc'].to_numpy()) / 3600
+    velocity = total_engagement / (hours_old + 0.1)
+    low_threshold, viral_threshold = np.quantile(total_engagement, [0.1, 0.9])
+    velocity_q80 = np.quantile(velocity, 0.8)
+    sentiment = reddit_df['sentiment_score'].to_numpy()
+    
+    return {
+        'total_engagement': total_engagement,
+        'hours_old': hours_old,
+        'velocity': velocity,
+        'is_viral': total_engagement > viral_threshold,
+        'low_threshold': low_threshold,
+        'viral_threshold': viral_threshold,
+        'predicted_viral': (velocity > velocity_q80) & (hours_old <= 12) & (np.abs(sentiment) > 0.1),
+        'velocity_q80': velocity_q80,
+        'sentiment_q70': np.quantile(np.abs(sentiment), 0.7)
+    }
 
 def get_extreme_sentiment_posts(posts, sentiment_type='positive'):
     """Get most positive or negative posts"""
@@ -465,6 +522,183 @@ def get_extreme_sentiment_posts(posts, sentiment_type='positive'):
     
     return sorted_posts[:5]  # Top 5
 
+def filter_active_subreddits(reddit_df, min_posts=MIN_SUBREDDIT_POSTS):
+    """Keep only posts from subreddits with at least min_posts posts"""
+    post_count = reddit_df.groupby('subreddit', sort=False, observed=True).size()
+    eligible = post_count.index[post_count.to_numpy() >= min_posts]
+    return reddit_df[reddit_df['subreddit'].isin(eligible)]
+
+def bucket_stats(bucket_index, values, minlength=0):
+    """Per-bucket count, sum, mean and sample std of values using np.bincount
+    
+    Empty buckets get a NaN mean, and buckets with fewer than two values a NaN std,
+    matching what a pandas groupby would report.
+    """
+    values = np.asarray(values, dtype=float)
+    counts = np.bincount(bucket_index, minlength=minlength)
+    sums = np.bincount(bucket_index, weights=values, minlength=minlength)
+    sq_sums = np.bincount(bucket_index, weights=values * values, minlength=minlength)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(counts > 0, sums / counts, np.nan)
+        var = np.where(counts > 1, (sq_sums - counts * mean * mean) / (counts - 1), np.nan)
+    std = np.sqrt(np.maximum(var, 0))
+    
+    return counts, sums, mean, std
+
+def sentiment_class_counts(sentiment):
+    """Neutral, positive (> 0.1) and negative (< -0.1) counts from a single bincount"""
+    sentiment = np.asarray(sentiment)
+    code = (sentiment > 0.1).astype(np.int8) | ((sentiment < -0.1).astype(np.int8) << 1)
+    neutral, positive, negative = (int(count) for count in np.bincount(code, minlength=3)[:3])
+    return neutral, positive, negative
+
+def top_k_indices(values, k):
+    """Positions of the k largest values, ordered largest first"""
+    if len(values) > k:
+        top = np.argpartition(-values, k)[:k]
+    else:
+        top = np.arange(len(values))
+    return top[np.argsort(-values[top], kind='stable')]
+
+def truncate_titles(titles, max_length):
+    """Shorten titles to max_length characters, appending an ellipsis when cut"""
+    titles = titles.astype(str)
+    return pd.Series(
+        np.where(titles.str.len() > max_length, titles.str.slice(0, max_length) + "...", titles),
+        index=titles.index
+    )
+
+@st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
+def get_hourly_reddit():
+    """Hourly engagement and sentiment aggregates, shared by the overview and sentiment tabs
+    
+    Grouped by SQLite on the stored hour_bucket column; only the per-hour rows come back.
+    """
+    hourly = db.get_hourly_reddit_stats(hours=24)
+    
+    # Sample standard deviation from the per-hour mean and mean of squares
+    n = hourly['sentiment_count'].to_numpy(dtype=float)
+    mean = hourly['sentiment_score'].to_numpy(dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var = np.where(n > 1, (hourly['sentiment_square_mean'].to_numpy(dtype=float) - mean * mean) * n / (n - 1), np.nan)
+    
+    return pd.DataFrame({
+        'hour': pd.to_datetime(hourly['hour_bucket'], unit='s'),
+        'score': hourly['score'],
+        'num_comments': hourly['num_comments'],
+        'sentiment_score': mean,
+        'sentiment_std': np.sqrt(np.maximum(var, 0)),
+        'virality_score': hourly['virality_score']
+    })
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_pulse_figures(hourly_data):
+    """Engagement, sentiment and virality pulse charts for the hourly aggregate"""
+    fig1 = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    fig1.add_trace(
+        go.Scattergl(
+            x=hourly_data['hour'],
+            y=hourly_data['score'],
+            mode='lines+markers',
+            name='Upvotes',
+            line=dict(color='#667eea', width=3),
+            fill='tonexty'
+        )
+    )
+    
+    fig1.add_trace(
+        go.Scattergl(
+            x=hourly_data['hour'],
+            y=hourly_data['num_comments'],
+            mode='lines+markers',
+            name='Comments',
+            line=dict(color='#764ba2', width=3)
+        ),
+        secondary_y=True
+    )
+    
+    fig1.update_layout(height=300, template='plotly_white', showlegend=True)
+    fig1.update_yaxes(title_text="Upvotes", secondary_y=False)
+    fig1.update_yaxes(title_text="Comments", secondary_y=True)
+    
+    # Sentiment chart
+    fig2 = go.Figure()
+    fig2.add_trace(
+        go.Scattergl(
+            x=hourly_data['hour'],
+            y=hourly_data['sentiment_score'],
+            mode='lines+markers',
+            name='Sentiment',
+            line=dict(color='#28a745', width=3),
+            fill='tozeroy'
+        )
+    )
+    fig2.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="Neutral")
+    fig2.update_layout(height=300, template='plotly_white')
+    
+    # Virality chart
+    fig3 = go.Figure()
+    fig3.add_trace(
+        go.Scattergl(
+            x=hourly_data['hour'],
+            y=hourly_data['virality_score'],
+            mode='lines+markers',
+            name='Virality',
+            line=dict(color='#dc3545', width=3),
+            fill='tozeroy'
+        )
+    )
+    fig3.update_layout(height=300, template='plotly_white')
+    
+    return fig1, fig2, fig3
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_sentiment_trend_figure(hourly_data):
+    """Hourly average sentiment with a one-standard-deviation band"""
+    hourly_sentiment = {
+        'hour': hourly_data['hour'],
+        'mean': hourly_data['sentiment_score'].to_numpy(),
+        'std': hourly_data['sentiment_std'].to_numpy()
+    }
+    
+    fig = go.Figure()
+    
+    # Add mean line
+    fig.add_trace(go.Scattergl(
+        x=hourly_sentiment['hour'],
+        y=hourly_sentiment['mean'],
+        mode='lines+markers',
+        name='Average Sentiment',
+        line=dict(color='#667eea', width=3)
+    ))
+    
+    # Add confidence band
+    fig.add_trace(go.Scattergl(
+        x=hourly_sentiment['hour'],
+        y=hourly_sentiment['mean'] + hourly_sentiment['std'],
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=hourly_sentiment['hour'],
+        y=hourly_sentiment['mean'] - hourly_sentiment['std'],
+        mode='lines',
+        line=dict(width=0),
+        fillcolor='rgba(102, 126, 234, 0.2)',
+        fill='tonexty',
+        showlegend=False,
+        name='Confidence Band'
+    ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="Neutral")
+    fig.update_layout(height=400, template='plotly_white')
+    
+    return fig
+
 def show_enhanced_metrics(analytics, reddit_df, news_df):
     """Show enhanced key metrics with beautiful styling"""
     
@@ -504,8 +738,7 @@ def show_enhanced_metrics(analytics, reddit_df, news_df):
     # Viral Content
     with col3:
         try:
-            viral_predictions = analytics.get('viral_predictions', [])
-            viral_count = len([p for p in viral_predictions if p.get('viral_potential', 0) > 5])
+            viral_count = int(np.count_nonzero(analytics.get('viral_potential', np.empty(0)) > 5))
         except:
             viral_count = 0
         
@@ -553,6 +786,9 @@ def show_human_behavior_insights(analytics):
 def show_overview_tab(analytics, reddit_df, news_df):
     """Enhanced overview dashboard"""
     
+    # Convert timestamps once; hour buckets and weekdays are derived from this
+    created_dt = pd.to_datetime(reddit_df['created_utc'], unit='s') if 'created_utc' in reddit_df.columns else None
+    
     # Enhanced metrics
     show_enhanced_metrics(analytics, reddit_df, news_df)
     
@@ -573,44 +809,12 @@ def show_overview_tab(analytics, reddit_df, news_df):
         
         if not reddit_df.empty:
             # Enhanced pulse visualization with containers
-            reddit_df['hour'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.floor('H')
-            hourly_data = reddit_df.groupby('hour').agg({
-                'score': 'sum',
-                'num_comments': 'sum',
-                'sentiment_score': 'mean',
-                'virality_score': 'mean'
-            }).reset_index()
+            hourly_data = get_hourly_reddit()
+            
+            fig1, fig2, fig3 = build_pulse_figures(hourly_data)
             
             # Create three separate charts with spacing
             st.markdown("#### 📈 Engagement Volume")
-            fig1 = make_subplots(specs=[[{"secondary_y": True}]])
-            
-            fig1.add_trace(
-                go.Scatter(
-                    x=hourly_data['hour'],
-                    y=hourly_data['score'],
-                    mode='lines+markers',
-                    name='Upvotes',
-                    line=dict(color='#667eea', width=3),
-                    fill='tonexty'
-                )
-            )
-            
-            fig1.add_trace(
-                go.Scatter(
-                    x=hourly_data['hour'],
-                    y=hourly_data['num_comments'],
-                    mode='lines+markers',
-                    name='Comments',
-                    line=dict(color='#764ba2', width=3)
-                ),
-                secondary_y=True
-            )
-            
-            fig1.update_layout(height=300, template='plotly_white', showlegend=True)
-            fig1.update_yaxes(title_text="Upvotes", secondary_y=False)
-            fig1.update_yaxes(title_text="Comments", secondary_y=True)
-            
             st.plotly_chart(fig1, use_container_width=True)
             
             # Add spacing between charts
@@ -618,20 +822,6 @@ def show_overview_tab(analytics, reddit_df, news_df):
             
             # Sentiment chart
             st.markdown("#### 💭 Average Sentiment")
-            fig2 = go.Figure()
-            fig2.add_trace(
-                go.Scatter(
-                    x=hourly_data['hour'],
-                    y=hourly_data['sentiment_score'],
-                    mode='lines+markers',
-                    name='Sentiment',
-                    line=dict(color='#28a745', width=3),
-                    fill='tozeroy'
-                )
-            )
-            fig2.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="Neutral")
-            fig2.update_layout(height=300, template='plotly_white')
-            
             st.plotly_chart(fig2, use_container_width=True)
             
             # Add spacing between charts
@@ -639,19 +829,6 @@ def show_overview_tab(analytics, reddit_df, news_df):
             
             # Virality chart
             st.markdown("#### 🚀 Virality Score")
-            fig3 = go.Figure()
-            fig3.add_trace(
-                go.Scatter(
-                    x=hourly_data['hour'],
-                    y=hourly_data['virality_score'],
-                    mode='lines+markers',
-                    name='Virality',
-                    line=dict(color='#dc3545', width=3),
-                    fill='tozeroy'
-                )
-            )
-            fig3.update_layout(height=300, template='plotly_white')
-            
             st.plotly_chart(fig3, use_container_width=True)
             
         else:
@@ -665,29 +842,31 @@ def show_overview_tab(analytics, reddit_df, news_df):
             st.markdown('<div class="trending-container">', unsafe_allow_html=True)
             
             # Sort by engagement (score + comments) and get top posts
-            reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
-            top_posts = reddit_df.nlargest(8, 'total_engagement')
+            total_engagement = analytics['viral_features']['total_engagement']
+            top_idx = top_k_indices(total_engagement, 8)
+            top_posts = reddit_df.iloc[top_idx]
+            
+            # Emoji and engagement color for every post in one vectorized pass
+            sentiment = top_posts['sentiment_score'].to_numpy()
+            engagement = total_engagement[top_idx]
+            top_posts = top_posts.assign(
+                short_title=truncate_titles(top_posts['title'], 60),
+                sentiment_emoji=np.select([sentiment > 0.1, sentiment < -0.1], ["😊", "😔"], default="😐"),
+                # Orange-red for high engagement, orange for medium, yellow for normal
+                border_color=np.select([engagement > 1000, engagement > 500], ["#ff5722", "#ff9800"], default="#ffeb3b")
+            )
             
-            for i, (_, post) in enumerate(top_posts.iterrows()):
-                sentiment_emoji = "😊" if post['sentiment_score'] > 0.1 else "😔" if post['sentiment_score'] < -0.1 else "😐"
-                
-                # Color coding based on subreddit activity
-                if post['total_engagement'] > 1000:
-                    border_color = "#ff5722"  # Orange-red for high engagement
-                elif post['total_engagement'] > 500:
-                    border_color = "#ff9800"  # Orange for medium engagement
-                else:
-                    border_color = "#ffeb3b"  # Yellow for normal engagement
-                
-                # Truncate title if too long
-                title = post['title'][:60] + "..." if len(post['title']) > 60 else post['title']
-                
-                st.markdown(f"""
-                <div style="border-left: 4px solid {border_color}; padding: 12px; margin: 10px 0; background: rgba(255, 255, 255, 0.8); border-radius: 0 8px 8px 0; color: #333;">
-                    <strong style="color: #d84315;">{i+1}. {title}</strong> {sentiment_emoji}<br>
-                    <small style="color: #bf360c;">⬆️ {post['score']} | 💬 {post['num_comments']} | r/{post['subreddit']}</small>
+            # Render all trending posts in a single markdown call
+            trending_html = [
+                f"""
+                <div style="border-left: 4px solid {post.border_color}; padding: 12px; margin: 10px 0; background: rgba(255, 255, 255, 0.8); border-radius: 0 8px 8px 0; color: #333;">
+                    <strong style="color: #d84315;">{i+1}. {post.short_title}</strong> {post.sentiment_emoji}<br>
+                    <small style="color: #bf360c;">⬆️ {post.score} | 💬 {post.num_comments} | r/{post.subreddit}</small>
                 </div>
-                """, unsafe_allow_html=True)
+                """
+                for i, post in enumerate(top_posts.itertuples(index=False))
+            ]
+            st.markdown("\n".join(trending_html), unsafe_allow_html=True)
             
             st.markdown('</div>', unsafe_allow_html=True)
         else:
@@ -697,7 +876,7 @@ def show_overview_tab(analytics, reddit_df, news_df):
     st.markdown("---")
     st.markdown("### 📊 Platform Analytics Overview")
     
-    if not reddit_df.empty:
+    if len(reddit_df) >= MIN_POSTS_FOR_ANALYSIS:
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -710,9 +889,11 @@ def show_overview_tab(analytics, reddit_df, news_df):
             avg_engagement = (reddit_df['score'] + reddit_df['num_comments']).mean()
             
             # Time-based patterns
-            reddit_df['hour'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.hour
-            peak_hour = reddit_df.groupby('hour')['score'].sum().idxmax()
-            peak_engagement = reddit_df.groupby('hour')['score'].sum().max()
+            hour_of_day = created_dt.dt.hour.to_numpy()
+            hour_counts, hour_score_sums, _, _ = bucket_stats(hour_of_day, reddit_df['score'].to_numpy(), minlength=24)
+            hourly_score = np.where(hour_counts > 0, hour_score_sums, np.nan)
+            peak_hour = int(np.nanargmax(hourly_score))
+            peak_engagement = int(np.nanmax(hourly_score))
             
             st.write(f"• Total posts analyzed: {total_posts:,}")
             st.write(f"• Total upvotes: {total_upvotes:,}")
@@ -725,26 +906,26 @@ def show_overview_tab(analytics, reddit_df, news_df):
             st.markdown("**🏆 Community Insights**")
             
             # Community analysis
-            community_stats = reddit_df.groupby('subreddit').agg({
+            community_stats = filter_active_subreddits(reddit_df).groupby('subreddit', observed=True).agg({
                 'score': ['sum', 'mean', 'count'],
                 'num_comments': 'sum',
                 'sentiment_score': 'mean'
             }).round(2)
             
             community_stats.columns = ['total_score', 'avg_score', 'post_count', 'total_comments', 'avg_sentiment']
-            community_stats = community_stats[community_stats['post_count'] >= 3].sort_values('total_score', ascending=False)
-            
-            # Most active community
-            most_active = community_stats.index[0]
-            most_engaging = community_stats.sort_values('avg_score', ascending=False).index[0]
-            most_positive = community_stats.sort_values('avg_sentiment', ascending=False).index[0]
             
-            st.write(f"• Most active: r/{most_active}")
-            st.write(f"  ({community_stats.loc[most_active, 'post_count']} posts)")
-            st.write(f"• Highest avg engagement: r/{most_engaging}")
-            st.write(f"  ({community_stats.loc[most_engaging, 'avg_score']:.0f} points)")
-            st.write(f"• Most positive: r/{most_positive}")
-            st.write(f"  ({community_stats.loc[most_positive, 'avg_sentiment']:.2f} sentiment)")
+            if not community_stats.empty:
+                # Leaders by each metric, without sorting the whole table
+                most_active = community_stats['total_score'].idxmax()
+                most_engaging = community_stats['avg_score'].idxmax()
+                most_positive = community_stats['avg_sentiment'].idxmax()
+                
+                st.write(f"• Most active: r/{most_active}")
+                st.write(f"  ({community_stats.loc[most_active, 'post_count']} posts)")
+                st.write(f"• Highest avg engagement: r/{most_engaging}")
+                st.write(f"  ({community_stats.loc[most_engaging, 'avg_score']:.0f} points)")
+                st.write(f"• Most positive: r/{most_positive}")
+                st.write(f"  ({community_stats.loc[most_positive, 'avg_sentiment']:.2f} sentiment)")
             
             # Community diversity
             unique_communities = len(community_stats)
@@ -754,21 +935,21 @@ def show_overview_tab(analytics, reddit_df, news_df):
             st.markdown("**🎯 Content Performance**")
             
             # Content analysis
-            reddit_df['title_length'] = reddit_df['title'].str.len()
-            reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
+            viral_features = analytics['viral_features']
+            title_length = reddit_df['title'].str.len()
+            total_engagement = viral_features['total_engagement']
             
             # Performance metrics
-            viral_threshold = reddit_df['total_engagement'].quantile(0.9)
-            viral_posts = len(reddit_df[reddit_df['total_engagement'] > viral_threshold])
-            low_performance = len(reddit_df[reddit_df['total_engagement'] < reddit_df['total_engagement'].quantile(0.1)])
+            low_threshold = viral_features['low_threshold']
+            viral_posts = int(viral_features['is_viral'].sum())
+            low_performance = np.count_nonzero(total_engagement < low_threshold)
             
-            avg_title_length = reddit_df['title_length'].mean()
-            optimal_length_posts = reddit_df.groupby(pd.cut(reddit_df['title_length'], bins=5))['total_engagement'].mean()
+            avg_title_length = title_length.mean()
+            optimal_length_posts = pd.Series(total_engagement, index=reddit_df.index).groupby(pd.cut(title_length, bins=5)).mean()
             best_length_range = optimal_length_posts.idxmax()
             
             avg_sentiment = reddit_df['sentiment_score'].mean()
-            positive_posts = len(reddit_df[reddit_df['sentiment_score'] > 0.1])
-            negative_posts = len(reddit_df[reddit_df['sentiment_score'] < -0.1])
+            _, positive_posts, negative_posts = sentiment_class_counts(reddit_df['sentiment_score'].to_numpy())
             
             st.write(f"• Viral posts (top 10%): {viral_posts}")
             st.write(f"• Poor performers: {low_performance}")
@@ -786,43 +967,45 @@ def show_overview_tab(analytics, reddit_df, news_df):
             st.markdown("**⏰ Temporal Patterns**")
             
             # Day of week analysis
-            reddit_df['day_of_week'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.day_name()
-            daily_engagement = reddit_df.groupby('day_of_week')['total_engagement'].mean().sort_values(ascending=False)
+            day_of_week = created_dt.dt.day_name().to_numpy()
+            daily_engagement = pd.Series(viral_features['total_engagement']).groupby(day_of_week).mean()
             
             st.write("**Best days for engagement:**")
-            for i, (day, engagement) in enumerate(daily_engagement.head(3).items()):
+            for i, (day, engagement) in enumerate(daily_engagement.nlargest(3).items()):
                 st.write(f"{i+1}. {day}: {engagement:.0f} avg engagement")
             
             # Hourly distribution
-            hourly_posts = reddit_df.groupby('hour').size()
-            busiest_hours = hourly_posts.sort_values(ascending=False).head(3)
+            busiest_hours = [hour for hour in np.argsort(-hour_counts, kind='stable')[:3] if hour_counts[hour] > 0]
             
             st.write(f"\n**Busiest posting hours:**")
-            for hour, count in busiest_hours.items():
-                st.write(f"• {hour}:00 - {count} posts")
+            for hour in busiest_hours:
+                st.write(f"• {hour}:00 - {hour_counts[hour]} posts")
         
         with col2:
             st.markdown("**🎭 Content Characteristics**")
             
-            # Engagement velocity
-            reddit_df['hours_old'] = (datetime.now().timestamp() - reddit_df['created_utc']) / 3600
-            reddit_df['velocity'] = reddit_df['total_engagement'] / (reddit_df['hours_old'] + 0.1)
+            # Engagement velocity from the cached viral features
+            velocity = viral_features['velocity']
             
-            fastest_growing = reddit_df.nlargest(3, 'velocity')[['title', 'subreddit', 'velocity']]
+            top_idx = top_k_indices(velocity, 3)
+            fastest_growing = reddit_df.iloc[top_idx][['title', 'subreddit']].assign(velocity=velocity[top_idx])
+            fastest_growing = fastest_growing.assign(short_title=truncate_titles(fastest_growing['title'], 50))
             
             st.write("**🚀 Fastest growing content:**")
             for i, (_, post) in enumerate(fastest_growing.iterrows()):
-                title = post['title'][:50] + "..." if len(str(post['title'])) > 50 else post['title']
+                title = post['short_title']
                 st.write(f"{i+1}. {title}")
                 st.write(f"   r/{post['subreddit']} • {post['velocity']:.1f}/hr")
             
             # Comment engagement patterns
             high_discussion = reddit_df[reddit_df['num_comments'] > reddit_df['num_comments'].quantile(0.8)]
             if len(high_discussion) > 0:
-                discussion_communities = high_discussion['subreddit'].value_counts().head(3)
+                discussion_communities = high_discussion.groupby('subreddit', observed=True).size().nlargest(3)
                 st.write(f"\n**💬 Most discussion-heavy:**")
                 for subreddit, count in discussion_communities.items():
                     st.write(f"• r/{subreddit}: {count} high-discussion posts")
+    elif not reddit_df.empty:
+        st.info("📊 Not enough data for full platform analytics yet")
     else:
         st.info("📊 No data available for platform analytics")
 
@@ -831,6 +1014,8 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
     
     st.markdown("### 💭 Sentiment vs Virality Analysis")
     
+    created_dt = pd.to_datetime(reddit_df['created_utc'], unit='s') if 'created_utc' in reddit_df.columns else None
+    
     # Sentiment-Virality correlation
     behavioral_report = analytics.get('behavioral_report', {})
     sentiment_virality = behavioral_report.get('sentiment_virality', {})
@@ -912,42 +1097,9 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
         st.markdown("### 📈 Sentiment Over Time")
         
         if not reddit_df.empty and 'sentiment_score' in reddit_df.columns:
-            reddit_df['hour'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.floor('H')
-            hourly_sentiment = reddit_df.groupby('hour')['sentiment_score'].agg(['mean', 'std']).reset_index()
-            
-            fig = go.Figure()
-            
-            # Add mean line
-            fig.add_trace(go.Scatter(
-                x=hourly_sentiment['hour'],
-                y=hourly_sentiment['mean'],
-                mode='lines+markers',
-                name='Average Sentiment',
-                line=dict(color='#667eea', width=3)
-            ))
-            
-            # Add confidence band
-            fig.add_trace(go.Scatter(
-                x=hourly_sentiment['hour'],
-                y=hourly_sentiment['mean'] + hourly_sentiment['std'],
-                mode='lines',
-                line=dict(width=0),
-                showlegend=False
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=hourly_sentiment['hour'],
-                y=hourly_sentiment['mean'] - hourly_sentiment['std'],
-                mode='lines',
-                line=dict(width=0),
-                fillcolor='rgba(102, 126, 234, 0.2)',
-                fill='tonexty',
-                showlegend=False,
-                name='Confidence Band'
-            ))
-            
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="Neutral")
-            fig.update_layout(height=400, template='plotly_white')
+            # Same hourly aggregate as the overview pulse charts
+            hourly_data = get_hourly_reddit()
+            fig = build_sentiment_trend_figure(hourly_data)
             st.plotly_chart(fig, use_container_width=True)
     
     # Add spacing
@@ -963,9 +1115,10 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
             st.markdown("#### 😊 Most Positive Posts")
             # Get most positive posts from dataframe
             positive_posts = reddit_df.nlargest(5, 'sentiment_score')[['title', 'subreddit', 'score', 'num_comments', 'sentiment_score', 'url']]
+            positive_posts = positive_posts.assign(short_title=truncate_titles(positive_posts['title'], 60))
             
             for i, (_, post) in enumerate(positive_posts.iterrows()):
-                title = post['title'][:60] + "..." if len(str(post['title'])) > 60 else post['title']
+                title = post['short_title']
                 st.markdown(f"""
                 <div class="post-card">
                     <div class="post-title">{i+1}. {title}</div>
@@ -980,9 +1133,10 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
             st.markdown("#### 😔 Most Negative Posts")
             # Get most negative posts from dataframe
             negative_posts = reddit_df.nsmallest(5, 'sentiment_score')[['title', 'subreddit', 'score', 'num_comments', 'sentiment_score', 'url']]
+            negative_posts = negative_posts.assign(short_title=truncate_titles(negative_posts['title'], 60))
             
             for i, (_, post) in enumerate(negative_posts.iterrows()):
-                title = post['title'][:60] + "..." if len(str(post['title'])) > 60 else post['title']
+                title = post['short_title']
                 st.markdown(f"""
                 <div class="post-card">
                     <div class="post-title">{i+1}. {title}</div>
@@ -999,35 +1153,42 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
     st.markdown("---")
     st.markdown("### 📊 Sentiment Analysis Insights")
     
-    if not reddit_df.empty:
+    if len(reddit_df) >= MIN_POSTS_FOR_ANALYSIS:
         # Calculate sentiment insights
         total_posts = len(reddit_df)
         avg_sentiment = reddit_df['sentiment_score'].mean()
         sentiment_std = reddit_df['sentiment_score'].std()
-        positive_posts_count = len(reddit_df[reddit_df['sentiment_score'] > 0.1])
-        negative_posts_count = len(reddit_df[reddit_df['sentiment_score'] < -0.1])
+        _, positive_posts_count, negative_posts_count = sentiment_class_counts(reddit_df['sentiment_score'].to_numpy())
         
         # Subreddit sentiment analysis
-        subreddit_sentiment = reddit_df.groupby('subreddit').agg({
+        subreddit_sentiment = filter_active_subreddits(reddit_df).groupby('subreddit', observed=True).agg({
             'sentiment_score': ['mean', 'count'],
             'score': 'mean'
         }).round(3)
         subreddit_sentiment.columns = ['avg_sentiment', 'post_count', 'avg_score']
-        subreddit_sentiment = subreddit_sentiment[subreddit_sentiment['post_count'] >= 3].sort_values('avg_sentiment', ascending=False)
+        subreddit_sentiment = subreddit_sentiment.sort_values('avg_sentiment', ascending=False)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.markdown("**🏆 Most Positive Communities**")
             top_positive = subreddit_sentiment.head(5)
-            for subreddit, data in top_positive.iterrows():
-                st.write(f"r/{subreddit}: {data['avg_sentiment']:.2f} ({int(data['post_count'])} posts)")
+            st.markdown("  \n".join(
+                f"r/{subreddit}: {avg_sentiment:.2f} ({int(post_count)} posts)"
+                for subreddit, avg_sentiment, post_count in zip(
+                    top_positive.index.to_numpy(), top_positive['avg_sentiment'].to_numpy(), top_positive['post_count'].to_numpy()
+                )
+            ))
         
         with col2:
             st.markdown("**😤 Most Negative Communities**")
             top_negative = subreddit_sentiment.tail(5)
-            for subreddit, data in top_negative.iterrows():
-                st.write(f"r/{subreddit}: {data['avg_sentiment']:.2f} ({int(data['post_count'])} posts)")
+            st.markdown("  \n".join(
+                f"r/{subreddit}: {avg_sentiment:.2f} ({int(post_count)} posts)"
+                for subreddit, avg_sentiment, post_count in zip(
+                    top_negative.index.to_numpy(), top_negative['avg_sentiment'].to_numpy(), top_negative['post_count'].to_numpy()
+                )
+            ))
         
         with col3:
             st.markdown("**📈 Key Sentiment Facts**")
@@ -1037,13 +1198,15 @@ def show_sentiment_analysis_tab(analytics, reddit_df):
             st.write(f"• Negative posts: {negative_posts_count} ({negative_posts_count/total_posts*100:.1f}%)")
             
             # Time-based sentiment insight
-            if 'created_utc' in reddit_df.columns:
-                reddit_df['hour'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.hour
-                hourly_sentiment = reddit_df.groupby('hour')['sentiment_score'].mean()
-                most_positive_hour = hourly_sentiment.idxmax()
-                most_negative_hour = hourly_sentiment.idxmin()
+            if created_dt is not None:
+                # Hours without posts are NaN so they never win argmax/argmin
+                _, _, hourly_sentiment, _ = bucket_stats(created_dt.dt.hour.to_numpy(), reddit_df['sentiment_score'].to_numpy(), minlength=24)
+                most_positive_hour = int(np.nanargmax(hourly_sentiment))
+                most_negative_hour = int(np.nanargmin(hourly_sentiment))
                 st.write(f"• Most positive hour: {most_positive_hour}:00")
                 st.write(f"• Most negative hour: {most_negative_hour}:00")
+    elif not reddit_df.empty:
+        st.info("📊 Not enough data for full sentiment insights yet")
 
 def show_behavioral_insights_tab(analytics, reddit_df):
     """Show detailed behavioral insights with enhanced statistics"""
@@ -1053,18 +1216,42 @@ def show_behavioral_insights_tab(analytics, reddit_df):
     behavioral_report = analytics.get('behavioral_report', {})
     content_insights = analytics.get('content_insights', {})
     
+    has_enough_data = len(reddit_df) >= MIN_POSTS_FOR_ANALYSIS
+    
+    if has_enough_data:
+        # Derive per-post metrics once as local arrays; both analysis sections below share them
+        viral_features = analytics['viral_features']
+        low_threshold, viral_threshold = viral_features['low_threshold'], viral_features['viral_threshold']
+        total_engagement = viral_features['total_engagement']
+        title_length = reddit_df['title'].str.len().to_numpy()
+        score = reddit_df['score'].to_numpy()
+        comment_rate = reddit_df['num_comments'].to_numpy() / np.where(score == 0, 1, score)
+        sentiment = reddit_df['sentiment_score'].to_numpy()
+        
+        created_dt = pd.to_datetime(reddit_df['created_utc'], unit='s')
+        hour_of_day = created_dt.dt.hour.to_numpy()
+        day_of_week = created_dt.dt.day_name().to_numpy()
+        
+        subreddit_metrics = reddit_df[['subreddit', 'sentiment_score']].assign(
+            total_engagement=total_engagement,
+            comment_rate=comment_rate
+        )
+        subreddit_stats = filter_active_subreddits(subreddit_metrics).groupby('subreddit', sort=False, observed=True).agg(
+            avg_engagement=('total_engagement', 'mean'),
+            total_engagement=('total_engagement', 'sum'),
+            post_count=('total_engagement', 'size'),
+            avg_comment_rate=('comment_rate', 'mean'),
+            avg_sentiment=('sentiment_score', 'mean')
+        ).round(2).sort_values('avg_engagement', ascending=False)
+    
     # Enhanced statistical insights section
     st.markdown("#### 📊 Content Length & Engagement Analysis")
     
-    if not reddit_df.empty:
-        # Calculate content statistics
-        reddit_df['title_length'] = reddit_df['title'].str.len()
-        reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
-        
+    if has_enough_data:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            avg_title_length = reddit_df['title_length'].mean()
+            avg_title_length = np.nanmean(title_length)
             st.metric(
                 "Avg Title Length",
                 f"{avg_title_length:.0f} chars",
@@ -1073,8 +1260,8 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         
         with col2:
             # Find optimal title length for engagement
-            reddit_df['length_bin'] = pd.cut(reddit_df['title_length'], bins=5, labels=['Very Short', 'Short', 'Medium', 'Long', 'Very Long'])
-            avg_engagement_by_length = reddit_df.groupby('length_bin')['total_engagement'].mean()
+            length_bin = pd.cut(title_length, bins=5, labels=['Very Short', 'Short', 'Medium', 'Long', 'Very Long'])
+            avg_engagement_by_length = pd.Series(total_engagement).groupby(length_bin).mean()
             optimal_length = avg_engagement_by_length.idxmax()
             st.metric(
                 "Optimal Title Length",
@@ -1084,7 +1271,7 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         
         with col3:
             # Sentiment-performance correlation
-            correlation = reddit_df[['sentiment_score', 'total_engagement']].corr().iloc[0, 1]
+            correlation = float(np.corrcoef(sentiment, total_engagement)[0, 1])
             correlation_strength = "Strong" if abs(correlation) > 0.5 else "Moderate" if abs(correlation) > 0.3 else "Weak"
             st.metric(
                 "Sentiment-Engagement",
@@ -1095,8 +1282,7 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         
         with col4:
             # Viral threshold
-            viral_threshold = reddit_df['total_engagement'].quantile(0.9)
-            viral_posts = (reddit_df['total_engagement'] > viral_threshold).sum()
+            viral_posts = np.count_nonzero(total_engagement > viral_threshold)
             st.metric(
                 "Viral Posts (Top 10%)",
                 f"{viral_posts}",
@@ -1108,7 +1294,7 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         st.markdown("#### 📈 Engagement Distribution by Title Length")
         
         fig = px.box(
-            reddit_df, 
+            pd.DataFrame({'length_bin': length_bin, 'total_engagement': total_engagement}), 
             x='length_bin', 
             y='total_engagement',
             title="Post Engagement by Title Length Category",
@@ -1121,12 +1307,13 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         st.markdown("#### 💭 Sentiment vs Engagement Correlation")
         
         fig = px.scatter(
-            reddit_df.sample(min(500, len(reddit_df))),  # Sample for performance
+            subreddit_metrics.sample(min(500, len(subreddit_metrics))),  # Sample for performance
             x='sentiment_score',
             y='total_engagement',
             color='subreddit',
             title="Sentiment Score vs Total Engagement",
-            labels={'sentiment_score': 'Sentiment Score', 'total_engagement': 'Total Engagement'}
+            labels={'sentiment_score': 'Sentiment Score', 'total_engagement': 'Total Engagement'},
+            render_mode='webgl'
         )
         fig.add_vline(x=0, line_dash="dash", line_color="gray", annotation_text="Neutral Sentiment")
         fig.update_layout(height=400, template='plotly_white')
@@ -1177,14 +1364,18 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         with col1:
             st.markdown("**🤬 Most Profane Communities**")
             most_profane = rankings.get('most_profane', [])
-            for i, (subreddit, data) in enumerate(most_profane[:5]):
-                st.write(f"{i+1}. r/{subreddit} - {data['avg_profanity']:.1f} curse words/post")
+            st.markdown("\n".join(
+                f"{i+1}. r/{subreddit} - {data['avg_profanity']:.1f} curse words/post"
+                for i, (subreddit, data) in enumerate(most_profane[:5])
+            ))
         
         with col2:
             st.markdown("**✨ Cleanest Communities**")
             cleanest = rankings.get('cleanest_language', [])
-            for i, (subreddit, data) in enumerate(cleanest[:5]):
-                st.write(f"{i+1}. r/{subreddit} - {data['avg_profanity']:.1f} curse words/post")
+            st.markdown("\n".join(
+                f"{i+1}. r/{subreddit} - {data['avg_profanity']:.1f} curse words/post"
+                for i, (subreddit, data) in enumerate(cleanest[:5])
+            ))
     
         # Engagement factors
     if 'engagement_factors' in behavioral_report:
@@ -1204,41 +1395,32 @@ def show_behavioral_insights_tab(analytics, reddit_df):
     st.markdown("---")
     st.markdown("### 📊 Advanced Behavioral Data Insights")
     
-    if not reddit_df.empty:
-        # Calculate advanced metrics
-        reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
-        reddit_df['comment_rate'] = reddit_df['num_comments'] / reddit_df['score'].replace(0, 1)
-        reddit_df['title_length'] = reddit_df['title'].str.len()
-        
-        # Time-based analysis
-        reddit_df['hour'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.hour
-        reddit_df['day_of_week'] = pd.to_datetime(reddit_df['created_utc'], unit='s').dt.day_name()
-        
+    if has_enough_data:
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.markdown("**⏰ Optimal Posting Times**")
-            hourly_engagement = reddit_df.groupby('hour')['total_engagement'].mean().sort_values(ascending=False)
-            best_hours = hourly_engagement.head(3)
+            _, _, hourly_engagement, _ = bucket_stats(hour_of_day, total_engagement, minlength=24)
+            best_hours = [hour for hour in np.argsort(-hourly_engagement, kind='stable')[:3] if not np.isnan(hourly_engagement[hour])]
             st.write("**Best hours to post:**")
-            for hour, engagement in best_hours.items():
-                st.write(f"• {hour}:00 - Avg engagement: {engagement:.0f}")
+            for hour in best_hours:
+                st.write(f"• {hour}:00 - Avg engagement: {hourly_engagement[hour]:.0f}")
             
             st.write("\n**Day of week analysis:**")
-            daily_engagement = reddit_df.groupby('day_of_week')['total_engagement'].mean().sort_values(ascending=False)
-            best_day = daily_engagement.index[0]
-            worst_day = daily_engagement.index[-1]
-            st.write(f"• Best day: {best_day} ({daily_engagement.iloc[0]:.0f} avg)")
-            st.write(f"• Worst day: {worst_day} ({daily_engagement.iloc[-1]:.0f} avg)")
+            daily_engagement = pd.Series(total_engagement).groupby(day_of_week).mean()
+            best_day = daily_engagement.idxmax()
+            worst_day = daily_engagement.idxmin()
+            st.write(f"• Best day: {best_day} ({daily_engagement[best_day]:.0f} avg)")
+            st.write(f"• Worst day: {worst_day} ({daily_engagement[worst_day]:.0f} avg)")
         
         with col2:
             st.markdown("**📝 Content Length Insights**")
             
             # Title length analysis
-            reddit_df['length_category'] = pd.cut(reddit_df['title_length'], 
-                                                bins=[0, 50, 100, 150, 300], 
-                                                labels=['Short', 'Medium', 'Long', 'Very Long'])
-            length_engagement = reddit_df.groupby('length_category')['total_engagement'].mean()
+            length_category = pd.cut(title_length, 
+                                     bins=[0, 50, 100, 150, 300], 
+                                     labels=['Short', 'Medium', 'Long', 'Very Long'])
+            length_engagement = pd.Series(total_engagement).groupby(length_category).mean()
             optimal_length = length_engagement.idxmax()
             
             st.write("**Title length performance:**")
@@ -1247,9 +1429,9 @@ def show_behavioral_insights_tab(analytics, reddit_df):
                 st.write(f"• {emoji} {category}: {engagement:.0f} avg engagement")
             
             # Comment to upvote ratio insights
-            avg_comment_rate = reddit_df['comment_rate'].mean()
-            high_discussion_threshold = reddit_df['comment_rate'].quantile(0.8)
-            controversial_posts = len(reddit_df[reddit_df['comment_rate'] > high_discussion_threshold])
+            avg_comment_rate = np.nanmean(comment_rate)
+            high_discussion_threshold = np.nanquantile(comment_rate, 0.8)
+            controversial_posts = np.count_nonzero(comment_rate > high_discussion_threshold)
             
             st.write(f"\n**Discussion patterns:**")
             st.write(f"• Avg comment rate: {avg_comment_rate:.2f}")
@@ -1258,25 +1440,16 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         with col3:
             st.markdown("**🏆 Community Performance**")
             
-            # Subreddit performance analysis
-            subreddit_stats = reddit_df.groupby('subreddit').agg({
-                'total_engagement': ['mean', 'sum', 'count'],
-                'comment_rate': 'mean',
-                'sentiment_score': 'mean'
-            }).round(2)
-            
-            subreddit_stats.columns = ['avg_engagement', 'total_engagement', 'post_count', 'avg_comment_rate', 'avg_sentiment']
-            subreddit_stats = subreddit_stats[subreddit_stats['post_count'] >= 3].sort_values('avg_engagement', ascending=False)
-            
             st.write("**Top performing communities:**")
             top_communities = subreddit_stats.head(5)
-            for subreddit, data in top_communities.iterrows():
-                st.write(f"• r/{subreddit}: {data['avg_engagement']:.0f} avg")
+            st.markdown("  \n".join(
+                f"• r/{subreddit}: {avg_engagement:.0f} avg"
+                for subreddit, avg_engagement in zip(top_communities.index.to_numpy(), top_communities['avg_engagement'].to_numpy())
+            ))
             
             # Engagement distribution
-            viral_threshold = reddit_df['total_engagement'].quantile(0.9)
-            viral_posts = len(reddit_df[reddit_df['total_engagement'] > viral_threshold])
-            low_engagement = len(reddit_df[reddit_df['total_engagement'] < reddit_df['total_engagement'].quantile(0.1)])
+            viral_posts = np.count_nonzero(total_engagement > viral_threshold)
+            low_engagement = np.count_nonzero(total_engagement < low_threshold)
             
             st.write(f"\n**Engagement distribution:**")
             st.write(f"• Viral posts (top 10%): {viral_posts}")
@@ -1291,10 +1464,14 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         with col1:
             # Correlation analysis
             st.markdown("**📈 Correlation Analysis**")
-            correlations = reddit_df[['sentiment_score', 'total_engagement', 'title_length', 'comment_rate']].corr()['total_engagement'].sort_values(ascending=False)
+            factors = ['sentiment_score', 'total_engagement', 'title_length', 'comment_rate']
+            # One covariance pass over all factors; only the engagement row is needed
+            corr_matrix = np.corrcoef(np.stack([sentiment, total_engagement, title_length, comment_rate]).astype(float))
+            engagement_corr = corr_matrix[factors.index('total_engagement')]
             
             st.write("**Factors most correlated with engagement:**")
-            for factor, corr in correlations.items():
+            for idx in np.argsort(-engagement_corr, kind='stable'):
+                factor, corr = factors[idx], engagement_corr[idx]
                 if factor != 'total_engagement':
                     strength = "Strong" if abs(corr) > 0.5 else "Moderate" if abs(corr) > 0.3 else "Weak"
                     direction = "positive" if corr > 0 else "negative"
@@ -1303,51 +1480,59 @@ def show_behavioral_insights_tab(analytics, reddit_df):
         with col2:
             # Engagement velocity patterns
             st.markdown("**⚡ Engagement Velocity Insights**")
-            reddit_df['hours_old'] = (datetime.now().timestamp() - reddit_df['created_utc']) / 3600
-            reddit_df['velocity'] = reddit_df['total_engagement'] / (reddit_df['hours_old'] + 0.1)
-            
-            velocity_stats = reddit_df['velocity'].describe()
-            high_velocity_posts = len(reddit_df[reddit_df['velocity'] > reddit_df['velocity'].quantile(0.9)])
+            velocity = viral_features['velocity']
+            high_velocity_posts = int(np.count_nonzero(velocity > np.quantile(velocity, 0.9)))
             
-            st.write(f"• Average velocity: {velocity_stats['mean']:.1f} points/hour")
-            st.write(f"• Fastest growing: {velocity_stats['max']:.1f} points/hour")
+            st.write(f"• Average velocity: {velocity.mean():.1f} points/hour")
+            st.write(f"• Fastest growing: {velocity.max():.1f} points/hour")
             st.write(f"• High-velocity posts: {high_velocity_posts}")
             
             # Find fastest growing posts
-            fastest_posts = reddit_df.nlargest(3, 'velocity')[['title', 'subreddit', 'velocity']]
+            top_idx = top_k_indices(velocity, 3)
+            fastest_posts = reddit_df.iloc[top_idx][['title', 'subreddit']].assign(velocity=velocity[top_idx])
+            fastest_posts = fastest_posts.assign(short_title=truncate_titles(fastest_posts['title'], 40))
             st.write("\n**🚀 Fastest growing posts:**")
-            for i, (_, post) in enumerate(fastest_posts.iterrows()):
-                title = post['title'][:40] + "..." if len(str(post['title'])) > 40 else post['title']
-                st.write(f"{i+1}. {title} ({post['velocity']:.1f}/hr)")
+            st.markdown("\n".join(
+                f"{i+1}. {title} ({velocity:.1f}/hr)"
+                for i, (title, velocity) in enumerate(zip(fastest_posts['short_title'].to_numpy(), fastest_posts['velocity'].to_numpy()))
+            ))
+    elif not reddit_df.empty:
+        st.info("📊 Not enough data for advanced behavioral analysis yet")
     else:
         st.info("📊 No data available for advanced behavioral analysis")
 
 def show_viral_predictions_tab(analytics, reddit_df):
     """Show viral predictions as styled lists with enhanced colors and export at bottom"""
+    # Cached per-post viral metrics shared by the timeline and pattern analysis; None without Reddit data
+    viral_features = analytics['viral_features']
     
     # 🏆 Top Viral Predictions Section
     st.markdown('<div class="viral-section-header">🏆 Top Viral Predictions</div>', unsafe_allow_html=True)
     
-    viral_predictions = analytics.get('viral_predictions', [])
+    pred_df = analytics.get('viral_predictions')
     
-    if viral_predictions:
-        pred_df = pd.DataFrame(viral_predictions)
+    if pred_df is not None and not pred_df.empty:
+        top_predictions = pred_df.head(10)
+        prediction_level = top_predictions['prediction'].fillna('emerging').to_numpy()
+        emoji = np.select(
+            [prediction_level == 'emerging', prediction_level == 'trending'],
+            ["🚀", "👀"], default="⭐"
+        )
         
         # Display as a styled list instead of graph
-        for i, pred in enumerate(pred_df.head(10).to_dict('records')):
-            prediction_level = pred.get('prediction', 'emerging')
-            emoji = "🚀" if prediction_level == 'emerging' else "👀" if prediction_level == 'trending' else "⭐"
-            
-            st.markdown(f"""
+        items = []
+        for i, pred in enumerate(top_predictions.itertuples(index=False)):
+            items.append(f"""
             <div class="viral-list-item">
-                <div class="viral-list-title">{i+1}. {pred['keyword']} {emoji}</div>
+                <div class="viral-list-title">{i+1}. {pred.keyword} {emoji[i]}</div>
                 <div class="viral-list-meta">
-                    Viral Score: <strong>{pred['viral_potential']:.1f}</strong> | 
-                    Mentions: <strong>{pred['mention_count']}</strong> | 
-                    Prediction: <strong style="color: #ff5722;">{prediction_level.title()}</strong>
+                    Viral Score: <strong>{pred.viral_potential:.1f}</strong> | 
+                    Mentions: <strong>{pred.mention_count}</strong> | 
+                    Prediction: <strong style="color: #ff5722;">{prediction_level[i].title()}</strong>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(items), unsafe_allow_html=True)
     else:
         st.info("🔍 No viral predictions available. Run analytics to generate predictions.")
     
@@ -1357,43 +1542,42 @@ def show_viral_predictions_tab(analytics, reddit_df):
     st.markdown('<div class="realtime-indicator">', unsafe_allow_html=True)
     
     if not reddit_df.empty:
-        # Calculate viral indicators
-        reddit_df['engagement_rate'] = (reddit_df['num_comments'] / reddit_df['score'].replace(0, 1)).fillna(0)
-        reddit_df['recency_hours'] = (datetime.now().timestamp() - reddit_df['created_utc']) / 3600
-        reddit_df['velocity'] = reddit_df['score'] / (reddit_df['recency_hours'] + 1)
+        # Calculate viral indicators as scratch arrays; this velocity is score-based
+        # and must not overwrite the engagement velocity used elsewhere
+        score = reddit_df['score'].to_numpy()
+        derived = {}
+        derived['engagement_rate'] = np.nan_to_num(reddit_df['num_comments'].to_numpy() / np.where(score == 0, 1, score), nan=0.0)
+        derived['recency_hours'] = (datetime.now().timestamp() - reddit_df['created_utc'].to_numpy()) / 3600
+        derived['velocity'] = score / (derived['recency_hours'] + 1)
+        
+        velocity_q80, velocity_q90, velocity_q95 = np.quantile(derived['velocity'], [0.8, 0.9, 0.95])
         
         # Get posts with high viral potential (last 12 hours only)
-        potential_viral = reddit_df[
-            (reddit_df['velocity'] > reddit_df['velocity'].quantile(0.8)) &
-            (reddit_df['recency_hours'] < 12)
-        ].nlargest(8, 'velocity')
+        candidates = np.flatnonzero((derived['velocity'] > velocity_q80) & (derived['recency_hours'] < 12))
+        top_idx = candidates[top_k_indices(derived['velocity'][candidates], 8)]
+        potential_viral = reddit_df.iloc[top_idx].assign(
+            velocity=derived['velocity'][top_idx],
+            recency_hours=derived['recency_hours'][top_idx]
+        )
         
         if not potential_viral.empty:
-            for i, (_, post) in enumerate(potential_viral.iterrows()):
-                title = post['title'][:75] + "..." if len(post['title']) > 75 else post['title']
-                
-                # Determine confidence level
-                if post['velocity'] > reddit_df['velocity'].quantile(0.95):
-                    confidence = "High"
-                    confidence_color = "#1976d2"
-                    confidence_emoji = "🔥"
-                elif post['velocity'] > reddit_df['velocity'].quantile(0.9):
-                    confidence = "Medium"
-                    confidence_color = "#1565c0"
-                    confidence_emoji = "📈"
-                else:
-                    confidence = "Emerging"
-                    confidence_color = "#1976d2"
-                    confidence_emoji = "📈"
-                
+            # Confidence level for every candidate in one vectorized pass
+            velocity = potential_viral['velocity'].to_numpy()
+            potential_viral = potential_viral.assign(
+                short_title=truncate_titles(potential_viral['title'], 75),
+                confidence=np.select([velocity > velocity_q95, velocity > velocity_q90], ["High", "Medium"], default="Emerging"),
+                confidence_emoji=np.where(velocity > velocity_q95, "🔥", "📈")
+            )
+            
+            for i, post in enumerate(potential_viral.itertuples(index=False)):
                 st.markdown(f"""
                 <div class="blue-viral-item">
-                    <div class="blue-viral-title">{i+1}. {title} {confidence_emoji}</div>
+                    <div class="blue-viral-title">{i+1}. {post.short_title} {post.confidence_emoji}</div>
                     <div class="blue-viral-meta">
-                        Velocity: <strong>{post['velocity']:.1f}/hr</strong> | 
-                        Age: <strong>{post['recency_hours']:.1f}h</strong> | 
-                        Confidence: <strong>{confidence}</strong> | 
-                        <span style="font-weight: bold;">r/{post['subreddit']}</span>
+                        Velocity: <strong>{post.velocity:.1f}/hr</strong> | 
+                        Age: <strong>{post.recency_hours:.1f}h</strong> | 
+                        Confidence: <strong>{post.confidence}</strong> | 
+                        <span style="font-weight: bold;">r/{post.subreddit}</span>
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
@@ -1410,31 +1594,34 @@ def show_viral_predictions_tab(analytics, reddit_df):
     st.markdown('<div class="timeline-container">', unsafe_allow_html=True)
     
     if not reddit_df.empty:
-        reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
-        viral_threshold = reddit_df['total_engagement'].quantile(0.9)
-        viral_posts = reddit_df[reddit_df['total_engagement'] > viral_threshold]
-        
-        if len(viral_posts) > 0:
-            viral_timeline = viral_posts.copy()
-            viral_timeline['datetime'] = pd.to_datetime(viral_timeline['created_utc'], unit='s')
-            viral_timeline = viral_timeline.sort_values('datetime', ascending=False)
-            recent_viral = viral_timeline.head(8)[['title', 'subreddit', 'total_engagement', 'sentiment_score', 'datetime']]
-            
-            for i, (_, post) in enumerate(recent_viral.iterrows()):
-                title = post['title'][:80] + "..." if len(str(post['title'])) > 80 else post['title']
-                time_str = post['datetime'].strftime('%m/%d %H:%M')
-                
-                st.markdown(f"""
+        viral_idx = np.flatnonzero(viral_features['is_viral'])
+        
+        if len(viral_idx) > 0:
+            # Newest viral posts first, selected without copying or sorting the whole viral subset
+            recent_idx = viral_idx[top_k_indices(reddit_df['created_utc'].to_numpy()[viral_idx], 8)]
+            recent_viral = reddit_df.iloc[recent_idx][['title', 'subreddit', 'sentiment_score', 'created_utc']]
+            recent_viral = recent_viral.assign(
+                total_engagement=viral_features['total_engagement'][recent_idx],
+                short_title=truncate_titles(recent_viral['title'], 80)
+            )
+            
+            # Render the whole timeline in a single markdown call
+            # (only the displayed rows need a datetime)
+            timeline_html = [
+                f"""
                 <div class="green-viral-item">
-                    <div class="green-viral-title">{i+1}. {title} 🔥</div>
+                    <div class="green-viral-title">{i+1}. {post.short_title} 🔥</div>
                     <div class="green-viral-meta">
-                        Engagement: <strong>{post['total_engagement']}</strong> | 
-                        Sentiment: <strong>{post['sentiment_score']:.2f}</strong> | 
-                        <span style="font-weight: bold;">r/{post['subreddit']}</span> | 
-                        <span>{time_str}</span>
+                        Engagement: <strong>{post.total_engagement}</strong> | 
+                        Sentiment: <strong>{post.sentiment_score:.2f}</strong> | 
+                        <span style="font-weight: bold;">r/{post.subreddit}</span> | 
+                        <span>{datetime.utcfromtimestamp(post.created_utc).strftime('%m/%d %H:%M')}</span>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
+                """
+                for i, post in enumerate(recent_viral.itertuples(index=False))
+            ]
+            st.markdown("\n".join(timeline_html), unsafe_allow_html=True)
         else:
             st.markdown('<div style="color: #2e7d32 !important; padding: 1rem; text-align: center;">🔍 No viral posts found for timeline.</div>', unsafe_allow_html=True)
     else:
@@ -1446,64 +1633,76 @@ def show_viral_predictions_tab(analytics, reddit_df):
     st.markdown("---")
     st.markdown("### 🔍 Advanced Viral Pattern Analysis")
     
-    if not reddit_df.empty:
-        # Calculate comprehensive viral metrics
-        reddit_df['total_engagement'] = reddit_df['score'] + reddit_df['num_comments']
-        reddit_df['hours_old'] = (datetime.now().timestamp() - reddit_df['created_utc']) / 3600
-        reddit_df['velocity'] = reddit_df['total_engagement'] / (reddit_df['hours_old'] + 0.1)
-        reddit_df['comment_rate'] = reddit_df['num_comments'] / reddit_df['score'].replace(0, 1)
-        reddit_df['title_length'] = reddit_df['title'].str.len()
+    if len(reddit_df) >= MIN_POSTS_FOR_ANALYSIS:
+        # Calculate comprehensive viral metrics as local arrays
+        score = reddit_df['score'].to_numpy()
+        hours_old = viral_features['hours_old']
+        velocity = viral_features['velocity']
+        comment_rate = reddit_df['num_comments'].to_numpy() / np.where(score == 0, 1, score)
+        total_engagement = viral_features['total_engagement']
+        title_length = reddit_df['title'].str.len().to_numpy()
+        
+        # Viral flag and prediction thresholds come from the cached viral features
+        is_viral = viral_features['is_viral']
+        velocity_threshold = viral_features['velocity_q80']
+        sentiment_threshold = viral_features['sentiment_q70']
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.markdown("**🎯 Viral Characteristics Analysis**")
             
-            # Define viral threshold (top 10% of posts)
-            viral_threshold = reddit_df['total_engagement'].quantile(0.9)
-            viral_posts = reddit_df[reddit_df['total_engagement'] > viral_threshold]
-            normal_posts = reddit_df[reddit_df['total_engagement'] <= viral_threshold]
-            
-            if len(viral_posts) > 0:
-                viral_avg_length = viral_posts['title_length'].mean()
-                normal_avg_length = normal_posts['title_length'].mean()
-                viral_avg_sentiment = viral_posts['sentiment_score'].mean()
-                normal_avg_sentiment = normal_posts['sentiment_score'].mean()
-                viral_avg_comment_rate = viral_posts['comment_rate'].mean()
-                normal_avg_comment_rate = normal_posts['comment_rate'].mean()
+            viral_posts = reddit_df.loc[is_viral, ['subreddit']]
+            vp_n = len(viral_posts)
+            
+            if vp_n > 0:
+                # Viral and normal averages in a single grouped reduction
+                viral_stats = pd.DataFrame({
+                    'title_length': title_length,
+                    'sentiment_score': reddit_df['sentiment_score'].to_numpy(),
+                    'comment_rate': comment_rate
+                }).groupby(is_viral).mean()
+                viral_avg, normal_avg = viral_stats.loc[True], viral_stats.loc[False]
                 
                 st.write("**Viral vs Normal Posts:**")
-                st.write(f"• Title length: {viral_avg_length:.0f} vs {normal_avg_length:.0f} chars")
-                st.write(f"• Sentiment: {viral_avg_sentiment:.3f} vs {normal_avg_sentiment:.3f}")
-                st.write(f"• Comment rate: {viral_avg_comment_rate:.2f} vs {normal_avg_comment_rate:.2f}")
+                st.write(f"• Title length: {viral_avg['title_length']:.0f} vs {normal_avg['title_length']:.0f} chars")
+                st.write(f"• Sentiment: {viral_avg['sentiment_score']:.3f} vs {normal_avg['sentiment_score']:.3f}")
+                st.write(f"• Comment rate: {viral_avg['comment_rate']:.2f} vs {normal_avg['comment_rate']:.2f}")
                 
                 # Most viral subreddits
-                viral_subreddits = viral_posts['subreddit'].value_counts().head(3)
+                viral_subreddits = viral_posts.groupby('subreddit', observed=True).size().nlargest(3)
                 st.write(f"\n**🏆 Most viral communities:**")
                 for subreddit, count in viral_subreddits.items():
-                    percentage = (count / len(viral_posts)) * 100
+                    percentage = (count / vp_n) * 100
                     st.write(f"• r/{subreddit}: {count} posts ({percentage:.1f}%)")
         
         with col2:
             st.markdown("**⚡ Real-Time Trending Indicators**")
             
             # Recent high-velocity posts (last 6 hours)
-            recent_posts = reddit_df[reddit_df['hours_old'] <= 6]
-            if len(recent_posts) > 0:
-                high_velocity = recent_posts[recent_posts['velocity'] > recent_posts['velocity'].quantile(0.8)]
+            recent_idx = np.flatnonzero(hours_old <= 6)
+            if len(recent_idx) > 0:
+                recent_velocity = velocity[recent_idx]
+                recent_velocity_threshold = np.quantile(recent_velocity, 0.8)
+                high_velocity_count = int(np.count_nonzero(recent_velocity > recent_velocity_threshold))
                 
-                st.write(f"**🚀 Trending now ({len(high_velocity)} posts):**")
-                trending_now = high_velocity.nlargest(5, 'velocity')[['title', 'subreddit', 'velocity', 'total_engagement']]
+                # The fastest recent posts are the high-velocity ones, so no filtered copy is needed
+                st.write(f"**🚀 Trending now ({high_velocity_count} posts):**")
+                top_idx = recent_idx[top_k_indices(recent_velocity, min(5, high_velocity_count))]
+                trending_now = reddit_df.iloc[top_idx][['title', 'subreddit']].assign(
+                    velocity=velocity[top_idx],
+                    total_engagement=total_engagement[top_idx]
+                )
+                trending_now = trending_now.assign(short_title=truncate_titles(trending_now['title'], 35))
                 
-                for i, (_, post) in enumerate(trending_now.iterrows()):
-                    title = post['title'][:35] + "..." if len(str(post['title'])) > 35 else post['title']
-                    st.write(f"{i+1}. {title}")
-                    st.write(f"   r/{post['subreddit']} • {post['velocity']:.1f}/hr • {post['total_engagement']:.0f} total")
+                for i, post in enumerate(trending_now.itertuples(index=False)):
+                    st.write(f"{i+1}. {post.short_title}")
+                    st.write(f"   r/{post.subreddit} • {post.velocity:.1f}/hr • {post.total_engagement:.0f} total")
                     st.write("")
                 
                 # Velocity distribution insights
-                avg_velocity = recent_posts['velocity'].mean()
-                max_velocity = recent_posts['velocity'].max()
+                avg_velocity = recent_velocity.mean()
+                max_velocity = recent_velocity.max()
                 st.write(f"**Velocity stats (6hr window):**")
                 st.write(f"• Average: {avg_velocity:.1f} points/hour")
                 st.write(f"• Peak: {max_velocity:.1f} points/hour")
@@ -1514,20 +1713,16 @@ def show_viral_predictions_tab(analytics, reddit_df):
             st.markdown("**🔮 Virality Prediction Factors**")
             
             # Calculate prediction accuracy metrics
-            reddit_df['predicted_viral'] = (
-                (reddit_df['velocity'] > reddit_df['velocity'].quantile(0.8)) &
-                (reddit_df['hours_old'] <= 12) &
-                (reddit_df['sentiment_score'].abs() > 0.1)
-            )
+            # Velocity > q80, age <= 12h and |sentiment| > 0.1, evaluated once with the cached features
+            predicted_viral = viral_features['predicted_viral']
             
-            actual_viral = reddit_df['total_engagement'] > viral_threshold
-            predicted_viral = reddit_df['predicted_viral']
+            actual_viral = viral_features['is_viral']
             
-            # Confusion matrix values
-            true_positives = sum(actual_viral & predicted_viral)
-            false_positives = sum(~actual_viral & predicted_viral)
-            true_negatives = sum(~actual_viral & ~predicted_viral)
-            false_negatives = sum(actual_viral & ~predicted_viral)
+            # Confusion matrix values: encode (actual, predicted) as 2*a + p and count all cells in one pass
+            cell_code = actual_viral.astype(np.uint8) * 2 + predicted_viral.astype(np.uint8)
+            true_negatives, false_positives, false_negatives, true_positives = (
+                int(count) for count in np.bincount(cell_code, minlength=4)
+            )
             
             if (true_positives + false_positives) > 0:
                 precision = true_positives / (true_positives + false_positives)
@@ -1541,24 +1736,23 @@ def show_viral_predictions_tab(analytics, reddit_df):
             
             # Key viral indicators
             st.write(f"\n**📊 Key Viral Indicators:**")
-            velocity_threshold = reddit_df['velocity'].quantile(0.8)
-            sentiment_threshold = reddit_df['sentiment_score'].abs().quantile(0.7)
-            
             st.write(f"• Velocity > {velocity_threshold:.1f}/hr")
             st.write(f"• |Sentiment| > {sentiment_threshold:.2f}")
             st.write(f"• Age < 12 hours")
             st.write(f"• High comment engagement")
             
             # Success stories
-            if len(viral_posts) > 0:
-                success_rate_by_subreddit = (viral_posts.groupby('subreddit').size() / 
-                                           reddit_df.groupby('subreddit').size() * 100).sort_values(ascending=False)
-                top_success_rate = success_rate_by_subreddit.head(3)
+            if vp_n > 0:
+                # Viral and total counts per subreddit from one grouped reduction
+                viral_counts = pd.Series(is_viral, index=reddit_df.index).groupby(reddit_df['subreddit'], observed=True).agg(['sum', 'count'])
+                viral_counts['rate'] = viral_counts['sum'] / viral_counts['count'] * 100
+                top_success_rate = viral_counts.loc[viral_counts['rate'] > 10, 'rate'].nlargest(3)  # Only show meaningful rates
                 
                 st.write(f"\n**🏅 Highest viral success rates:**")
                 for subreddit, rate in top_success_rate.items():
-                    if rate > 10:  # Only show meaningful rates
-                        st.write(f"• r/{subreddit}: {rate:.0f}%")
+                    st.write(f"• r/{subreddit}: {rate:.0f}%")
+    elif not reddit_df.empty:
+        st.info("📊 Not enough data for viral pattern analysis yet")
     else:
         st.info("📊 No data available for viral pattern analysis")
     
@@ -1585,32 +1779,72 @@ def show_viral_predictions_tab(analytics, reddit_df):
         """, unsafe_allow_html=True)
     
     with col2:
+        export_format = st.radio("Export format", ["CSV", "Parquet"], horizontal=True)
+        
         if st.button("📊 Export Dataset", type="primary"):
             # Generate export data
             if not reddit_df.empty:
-                export_data = reddit_df[['title', 'subreddit', 'score', 'num_comments', 'sentiment_score', 'created_utc', 'url']].copy()
-                
-                # Add calculated features
-                export_data['total_engagement'] = export_data['score'] + export_data['num_comments']
-                export_data['title_length'] = export_data['title'].str.len()
-                export_data['engagement_rate'] = export_data['num_comments'] / export_data['score'].replace(0, 1)
+                # Column selection already yields a new frame; add calculated features on it directly
+                score = reddit_df['score'].to_numpy()
+                export_data = reddit_df[['title', 'subreddit', 'score', 'num_comments', 'sentiment_score', 'created_utc', 'url']].assign(
+                    total_engagement=reddit_df['score'] + reddit_df['num_comments'],
+                    title_length=reddit_df['title'].str.len(),
+                    engagement_rate=reddit_df['num_comments'].to_numpy() / np.where(score == 0, 1, score)
+                )
                 
-                csv_data = export_data.to_csv(index=False)
+                # Serialize straight into a bytes buffer to skip the str -> bytes round-trip
+                buffer = io.BytesIO()
+                if export_format == "Parquet":
+                    export_data.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+                    file_ext, mime = "parquet", "application/octet-stream"
+                else:
+                    export_data.to_csv(buffer, index=False, lineterminator='\n')
+                    file_ext, mime = "csv", "text/csv"
                 
                 st.download_button(
-                    label="💾 Download CSV",
-                    data=csv_data,
-                    file_name=f"social_pulse_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    label=f"💾 Download {export_format}",
+                    data=buffer.getvalue(),
+                    file_name=f"social_pulse_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_ext}",
+                    mime=mime
                 )
                 
                 st.success("✅ Dataset ready for download!")
             else:
                 st.warning("No data available for export")
 
+def collect_and_store_data():
+    """Collect Reddit and News data concurrently, storing each source as soon as it arrives"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            executor.submit(reddit_collector.collect_all_posts): 'reddit',
+            executor.submit(news_collector.collect_all_articles): 'news'
+        }
+        
+        for future in as_completed(futures):
+            items = future.result()
+            if not items:
+                continue
+            
+            if futures[future] == 'reddit':
+                analyzed_posts = sentiment_analyzer.analyze_reddit_posts(items)
+                db.insert_reddit_posts([post.to_dict() for post in analyzed_posts])
+            else:
+                analyzed_articles = sentiment_analyzer.analyze_news_articles(items)
+                db.insert_news_articles([article.to_dict() for article in analyzed_articles])
+    
+    # Make the newly stored rows visible on the next run
+    load_data.clear()
+    get_hourly_reddit.clear()
+
 def main():
     """Enhanced main dashboard function"""
     
+    # Opt-in rerun from the browser every collection interval; nothing blocks the script thread between refreshes
+    auto_refresh = st.sidebar.checkbox("🔄 Auto-refresh page", value=False,
+                                       help=f"Reload the dashboard every {config.UPDATE_INTERVAL} minutes")
+    if auto_refresh:
+        st_autorefresh(interval=config.UPDATE_INTERVAL * 60 * 1000, key="pulse_refresh")
+    
     # Header with improved styling
     st.markdown('<h1 class="main-header">🧠 Social Pulse Analytics</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header"><strong>Understanding Human Nature Through Social Media Patterns</strong></p>', unsafe_allow_html=True)
@@ -1633,17 +1867,7 @@ def main():
             with st.spinner("🔄 Refreshing data..."):
                 # Force new data collection
                 try:
-                    # Collect Reddit data
-                    reddit_posts = reddit_collector.collect_all_posts()
-                    if reddit_posts:
-                        analyzed_posts = sentiment_analyzer.analyze_reddit_posts(reddit_posts)
-                        db.insert_reddit_posts([post.to_dict() for post in analyzed_posts])
-                    
-                    # Collect News data
-                    news_articles = news_collector.collect_all_articles()
-                    if news_articles:
-                        analyzed_articles = sentiment_analyzer.analyze_news_articles(news_articles)
-                        db.insert_news_articles([article.to_dict() for article in analyzed_articles])
+                    collect_and_store_data()
                     
                     st.success("✅ Data refreshed successfully!")
                     time.sleep(1)  # Brief pause to show success message
@@ -1694,17 +1918,7 @@ def main():
         with st.spinner("🚀 Collecting data... This will take 2-3 minutes"):
             # Auto-collect data
             try:
-                # Collect Reddit data
-                reddit_posts = reddit_collector.collect_all_posts()
-                if reddit_posts:
-                    analyzed_posts = sentiment_analyzer.analyze_reddit_posts(reddit_posts)
-                    db.insert_reddit_posts([post.to_dict() for post in analyzed_posts])
-                
-                # Collect News data
-                news_articles = news_collector.collect_all_articles()
-                if news_articles:
-                    analyzed_articles = sentiment_analyzer.analyze_news_articles(news_articles)
-                    db.insert_news_articles([article.to_dict() for article in analyzed_articles])
+                collect_and_store_data()
                 
                 st.success("✅ Data collection completed!")
                 st.rerun()
@@ -1713,15 +1927,13 @@ def main():
                 st.error(f"❌ Data collection failed: {e}")
                 st.stop()
     
-    # Load analytics data
-    analytics_result = get_enhanced_analytics_data()
+    # Load analytics data for the frames loaded above
+    analytics = get_enhanced_analytics_data(reddit_df, news_df, refresh_window=int(time.time() // 1800))
     
-    if not analytics_result:
+    if not analytics:
         st.error("❌ Error processing analytics data")
         st.stop()
     
-    analytics, reddit_df, news_df = analytics_result
-    
     # Enhanced tabbed interface
     tab1, tab2, tab3, tab4 = st.tabs([
         "🎯 Overview", 
@@ -5,9 +5,9 @@ Handles application startup, data collection scheduling, and dashboard launch
 import os
 import sys
 import threading
-import time
 import schedule
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add app directory to path
@@ -28,9 +28,14 @@ def collect_and_analyze_data():
         config.validate_config()
         print("✅ Configuration validated")
         
-        # Collect Reddit data
+        # Both collectors are I/O-bound, so fetch Reddit and News concurrently
         print("📱 Collecting Reddit data...")
-        reddit_posts = reddit_collector.collect_all_posts()
+        print("📰 Collecting News data...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reddit_future = executor.submit(reddit_collector.collect_all_posts)
+            news_future = executor.submit(news_collector.collect_all_articles)
+            reddit_posts = reddit_future.result()
+            news_articles = news_future.result()
         
         if reddit_posts:
             print(f"   Found {len(reddit_posts)} Reddit posts")
@@ -45,10 +50,6 @@ def collect_and_analyze_data():
         else:
             print("   ⚠️ No Reddit posts collected")
         
-        # Collect News data
-        print("📰 Collecting News data...")
-        news_articles = news_collector.collect_all_articles()
-        
         if news_articles:
             print(f"   Found {len(news_articles)} news articles")
             
@@ -78,6 +79,9 @@ def collect_and_analyze_data():
     
     return True
 
+# Set to stop the background scheduler thread
+scheduler_stop_event = threading.Event()
+
 def setup_scheduler():
     """Setup the data collection scheduler"""
     # Schedule data collection every 30 minutes
@@ -85,9 +89,11 @@ def setup_scheduler():
     print(f"⏰ Scheduled data collection every {config.UPDATE_INTERVAL} minutes")
     
     def run_scheduler():
-        while True:
+        while not scheduler_stop_event.is_set():
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Sleep until the next job is due instead of polling; wakes early on stop
+            idle_seconds = schedule.idle_seconds()
+            scheduler_stop_event.wait(timeout=max(1, idle_seconds) if idle_seconds is not None else 60)
     
     # Run scheduler in background thread
     scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
@@ -211,6 +217,7 @@ def main():
                 
             except KeyboardInterrupt:
                 print("\n⏹️  Stopping application...")
+                scheduler_stop_event.set()
                 dashboard_process.terminate()
                 print("👋 Goodbye!")
         else: